@@ -1,11 +1,13 @@
 """Base step class for text processing pipeline."""
 
+import os
 import time
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Callable, List, Optional, Tuple
 
 from ..exceptions import StepError
+from .pool import run_in_pool
 
 logger = logging.getLogger(__name__)
 
@@ -28,20 +30,83 @@ class BaseStep(ABC):
         """Process the input text and return processed text."""
         pass
 
+    def process_batch(self, texts: List[str], n_process: int = 1) -> List[str]:
+        """Process several texts, returning one output per input.
+
+        Steps that can amortize work across texts, such as running spaCy
+        over a batch, override this; the default processes each in turn.
+        With n_process above 1 (or -1 for one per CPU) the texts are
+        spread across that many worker processes.
+        """
+        self._check_n_process(n_process)
+        if n_process == 1 or len(texts) < 2:
+            return [self.process(text) for text in texts]
+
+        workers = (os.cpu_count() or 1) if n_process == -1 else n_process
+        return run_in_pool(self, _process_with_step, texts, workers)
+
+    @staticmethod
+    def _check_n_process(n_process: int) -> None:
+        """Reject process counts other than a positive number or -1."""
+        if n_process == 0 or n_process < -1:
+            raise ValueError(
+                f"n_process must be a positive number of processes or -1 for one per CPU, got {n_process}")
+
     def execute(self, text: str) -> Tuple[str, float]:
         """Execute the step with timing and error handling."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         try:
-            logger.debug(f"Executing step {self.__class__.__name__}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Executing step %s", self.__class__.__name__)
             result = self.process(text)
-            execution_time = time.time() - start_time
-            logger.debug(
-                f"Step {self.__class__.__name__} completed in {execution_time:.4f}s")
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
+            if debug:
+                logger.debug("Step %s completed in %.4fs",
+                             self.__class__.__name__, execution_time)
             return result, execution_time
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_time) * 1e-9
             logger.error(
                 f"Step {self.__class__.__name__} failed after {execution_time:.4f}s: {e}")
             raise StepError(self.__class__.__name__, str(e), e)
+
+
+def _process_with_step(step: BaseStep, text: str) -> str:
+    """Process one text with a worker's copy of the step."""
+    return step.process(text)
+
+
+def _identity(text: str) -> str:
+    """Return the text unchanged; the chain of no passes."""
+    return text
+
+
+def chain_passes(passes: List[Optional[Callable[[str], str]]]) -> Callable[[str], str]:
+    """Compose text passes, applied left to right, into one function.
+
+    None entries are disabled passes and are left out, so a step can
+    list its candidate passes once and get a function containing only
+    the enabled ones. Chains of one or two passes avoid the loop.
+    """
+    enabled = [text_pass for text_pass in passes if text_pass is not None]
+    if not enabled:
+        return _identity
+    if len(enabled) == 1:
+        return enabled[0]
+    if len(enabled) == 2:
+        first, second = enabled
+
+        def chained(text: str) -> str:
+            return second(first(text))
+
+        return chained
+
+    def chained(text: str) -> str:
+        for text_pass in enabled:
+            text = text_pass(text)
+        return text
+
+    return chained
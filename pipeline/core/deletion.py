@@ -0,0 +1,70 @@
+"""Character deletion passes shared by the transform step and fused execution."""
+
+import string
+from typing import Callable, Dict, Optional, Tuple
+
+from . import regex_engine
+from .regex_engine import DIGIT, SPACE
+
+_ASCII_ALNUM = frozenset(string.ascii_letters + string.digits)
+
+
+class DeletionTable(dict):
+    """str.translate table that deletes every character matching a predicate.
+
+    Entries are filled in on first lookup, so the table covers all of
+    Unicode while only ever storing the code points actually seen.
+    """
+
+    def __init__(self, delete: Callable[[str], bool]):
+        """Initialize the table with the deletion predicate."""
+        super().__init__()
+        self._delete = delete
+
+    def __missing__(self, codepoint: int):
+        value = None if self._delete(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+def _is_special(char: str) -> bool:
+    """Match the regex class [^a-zA-Z0-9\\s]."""
+    return char not in _ASCII_ALNUM and not char.isspace()
+
+
+# Deletion tables keyed by (remove_numbers, remove_special_chars).
+# str.isdecimal and str.isspace agree with re's \d and \s for str patterns.
+_DELETION_TABLES: Dict[Tuple[bool, bool], DeletionTable] = {
+    (True, False): DeletionTable(str.isdecimal),
+    (False, True): DeletionTable(_is_special),
+    (True, True): DeletionTable(lambda char: char.isdecimal() or _is_special(char)),
+}
+
+# The same deletions as single-pass patterns, for text outside ASCII.
+_DELETION_PATTERNS = {
+    (True, False): regex_engine.compile(f'[{DIGIT}]+'),
+    (False, True): regex_engine.compile(f'[^a-zA-Z0-9{SPACE}]+'),
+    (True, True): regex_engine.compile(f'[^a-zA-Z{SPACE}]+'),
+}
+
+
+def build_deleter(remove_numbers: bool, remove_special_chars: bool) -> Optional[Callable[[str], str]]:
+    """Build a single pass deleting digits and/or special characters.
+
+    ASCII text goes through str.translate, which caches ASCII mappings
+    internally. For other text translate falls back to a mapping lookup
+    per character, so a single regex pass is faster there. Returns None
+    when nothing is to be deleted.
+    """
+    key = (bool(remove_numbers), bool(remove_special_chars))
+    table = _DELETION_TABLES.get(key)
+    if table is None:
+        return None
+    pattern_sub = _DELETION_PATTERNS[key].sub
+
+    def delete(text: str) -> str:
+        if text.isascii():
+            return text.translate(table)
+        return pattern_sub('', text)
+
+    return delete
@@ -0,0 +1,79 @@
+"""Fused execution of adjacent clean and transform steps."""
+
+from typing import Callable, Optional
+
+from ..steps.clean_step import CleanStep
+from ..steps.transform_step import TransformStep
+from .base_step import chain_passes
+from .deletion import build_deleter
+
+
+def can_fuse(clean_step: object, transform_step: object) -> bool:
+    """Check whether a clean -> transform pair can run as one fused pass.
+
+    Only the regex-based paths are fused; spaCy processing needs the
+    intermediate text to build its Doc.
+    """
+    return (isinstance(clean_step, CleanStep) and clean_step.nlp is None
+            and isinstance(transform_step, TransformStep) and transform_step.nlp is None)
+
+
+def can_stream(clean_step: object, transform_step: object) -> bool:
+    """Check whether a clean step can hand its tokens to a transform step.
+
+    The clean step must tokenize, with the fast filter or with spaCy
+    filters, and the transform step must use a spaCy model.
+    """
+    return (isinstance(clean_step, CleanStep)
+            and (clean_step._fast_filter or (clean_step.nlp is not None and clean_step._uses_spacy))
+            and isinstance(transform_step, TransformStep)
+            and transform_step.nlp is not None and transform_step._uses_spacy)
+
+
+def build_token_stream(clean_step: object, transform_step: object) -> Optional[Callable[[str], str]]:
+    """Build a clean -> transform function that passes tokens between them.
+
+    The transform step builds its Doc from the clean step's tokens,
+    so the text is tokenized once and the intermediate string is never
+    joined. spaCy may tokenize the joined (and lowercased) text slightly
+    differently, so this is opt-in. Returns None when the pair can't
+    stream.
+    """
+    if not can_stream(clean_step, transform_step):
+        return None
+
+    clean_tokens = clean_step.clean_to_tokens
+    transform_tokens = transform_step.transform_from_tokens
+
+    def clean_transform(text: str) -> str:
+        return transform_tokens(clean_tokens(text))
+
+    return clean_transform
+
+
+def build_clean_transform(clean_step: object, transform_step: object) -> Optional[Callable[[str], str]]:
+    """Build a fused clean -> transform function for the steps' parameters.
+
+    The deletion table and flags are resolved here, once per pipeline,
+    so the returned function does no parameter lookups per text. Digit
+    and special character removal share a single deletion pass.
+    When stemming is enabled the text is re-split on whitespace anyway,
+    so the clean step is skipped unless it also filters tokens. Returns
+    None when the pair can't be fused.
+    """
+    if not can_fuse(clean_step, transform_step):
+        return None
+
+    params = transform_step.params
+    delete = build_deleter(params['remove_numbers'], params['remove_special_chars'])
+    stem = transform_step._simple_stemming if params['apply_stemming'] else None
+
+    if clean_step._fast_filter:
+        clean = clean_step.process
+    elif stem is None:
+        # Whitespace must be collapsed before deleting characters between spaces
+        clean = clean_step._normalize_whitespace
+    else:
+        clean = None
+
+    return chain_passes([clean, delete, stem])
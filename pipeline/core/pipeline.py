@@ -1,10 +1,12 @@
 """Main text processing pipeline."""
 
+import os
+import string
 import time
 import logging
-from typing import Union, List, Dict, Any
+from types import TracebackType
+from typing import Union, List, Dict, Any, Callable, NamedTuple, Optional, Tuple
 
-import spacy
 from rich.logging import RichHandler
 from rich.console import Console
 from rich.traceback import install
@@ -12,8 +14,13 @@ from rich.traceback import install
 from ..exceptions import StepError, ConfigurationError
 from ..models.config import PipelineConfig
 from ..models.data import ProcessingResult
+from ..steps.analyze_step import AnalyzeStep
+from .base_step import BaseStep
 from .step_registry import StepRegistry
 from .statistics import StatisticsCollector
+from .fused import build_clean_transform, build_token_stream
+from .pool import run_in_pool
+from .spacy_loader import PIPE_BATCH_SIZE, PIPELINE_COMPONENTS, load_english_model
 
 # Setup rich logging
 install()
@@ -23,6 +30,50 @@ logging.basicConfig(level=logging.INFO, format="%(message)s",
                     handlers=[rich_handler])
 logger = logging.getLogger(__name__)
 
+# Default parameters for the built-in steps
+DEFAULT_STEP_PARAMS: Dict[str, Dict[str, Any]] = {
+    'clean': {
+        'remove_extra_spaces': True,
+        'preserve_newlines': False,
+        'trim_edges': True,
+        'lowercase': True,
+        'remove_punctuation': True,
+        'remove_stopwords': True,
+        'fast_tokenizer': False
+    },
+    'transform': {
+        'to_lowercase': True,
+        'remove_punctuation': True,
+        'remove_numbers': True,
+        'remove_special_chars': True,
+        'apply_stemming': True
+    },
+    'analyze': {
+        'count_words': True,
+        'count_characters': True,
+        'count_sentences': True,
+        'count_paragraphs': True,
+        'average_word_length': True,
+        'reading_level': True,
+        'cache_results': False
+    }
+}
+
+# Sample text for warmup(), covering every printable ASCII character
+WARMUP_TEXT = ("The pipeline is warming up: 42 sentences, two paragraphs!\n\n"
+               "Is this working? Yes. " + string.printable)
+
+
+class CompiledStep(NamedTuple):
+    """A configured step, resolved once and reused for every text."""
+    name: str
+    params: Dict[str, Any]
+    step: Union[BaseStep, Exception]  # Instance or instantiation error
+    # Fused function covering this step and the next, if they can be fused
+    fused: Optional[Callable[[str], str]] = None
+    # Traceback of the instantiation error, restored on every re-raise
+    error_traceback: Optional[TracebackType] = None
+
 
 class TextPipeline:
     """Main text processing pipeline."""
@@ -39,20 +90,18 @@ class TextPipeline:
 
         self.step_registry = StepRegistry()
         self.statistics = StatisticsCollector()
+        self._resolved_params: Dict[str, Dict[str, Any]] = {}
+        self._compiled_steps: Optional[List[CompiledStep]] = None
 
-        # Load spaCy model for tokenization
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # Fallback to basic English model if en_core_web_sm is not available
-            try:
-                self.nlp = spacy.load("en_core_web_lg")
-            except OSError:
-                # If no spaCy model is available, we'll handle it gracefully
-                self.nlp = None
+        # Load spaCy model for tokenization. Only token.text is read, so
+        # no pipeline components are needed.
+        self.nlp = load_english_model(PIPELINE_COMPONENTS)
 
         self._validate_config()
 
+        if self.config.warmup:
+            self.warmup()
+
     def _validate_config(self) -> None:
         """Validate the pipeline configuration."""
         # Validate that all configured steps exist
@@ -63,129 +112,311 @@ class TextPipeline:
                     f"Unknown step '{step}' in configuration. Available steps: {available_steps}")
 
     def _get_step_params(self, step_name: str) -> Dict[str, Any]:
-        """Get parameters for a specific step."""
-        # Get default parameters for the step
-        default_params = self._get_default_params(step_name)
-
-        # Override with user-provided parameters
-        user_params = self.config.step_params.get(step_name, {})
-        default_params.update(user_params)
+        """Get parameters for a specific step, resolved once per step name."""
+        params = self._resolved_params.get(step_name)
+        if params is None:
+            # Default parameters overridden with user-provided parameters
+            params = {**self._get_default_params(step_name),
+                      **self.config.step_params.get(step_name, {})}
+            self._resolved_params[step_name] = params
 
-        return default_params
+        return params
 
     def _get_default_params(self, step_name: str) -> Dict[str, Any]:
         """Get default parameters for a step."""
-        if step_name == 'clean':
-            return {
-                'remove_extra_spaces': True,
-                'preserve_newlines': False,
-                'trim_edges': True,
-                'lowercase': True,
-                'remove_punctuation': True,
-                'remove_stopwords': True
-            }
-        elif step_name == 'transform':
-            return {
-                'to_lowercase': True,
-                'remove_punctuation': True,
-                'remove_numbers': True,
-                'remove_special_chars': True,
-                'apply_stemming': True
-            }
-        elif step_name == 'analyze':
-            return {
-                'count_words': True,
-                'count_characters': True,
-                'count_sentences': True,
-                'count_paragraphs': True,
-                'average_word_length': True,
-                'reading_level': True
-            }
-        else:
-            return {}
+        return dict(DEFAULT_STEP_PARAMS.get(step_name, {}))
 
     def process(self, text: Union[str, List[str]]) -> Union[ProcessingResult, List[ProcessingResult]]:
         """Process text through the configured pipeline."""
+        steps = self._build_steps()
         if isinstance(text, list):
-            return [self._process_single(item) for item in text]
+            if self.config.parallel and len(text) > 1:
+                return self._process_parallel(text)
+            # With 'stop', texts run one at a time so the first failing
+            # text raises before any later text is processed
+            if self.config.error_handling == 'continue' and len(text) > 1:
+                return self._process_batch_with_steps(text, steps)
+            return [self._process_single_with_steps(item, steps) for item in text]
         else:
-            return self._process_single(text)
+            return self._process_single_with_steps(text, steps)
+
+    def _build_steps(self) -> List[CompiledStep]:
+        """Resolve parameters and instantiate each configured step once.
+
+        Steps are cached on the pipeline and reused for every processed
+        text. A step that fails to instantiate is cached as its exception
+        so each text still records (or raises) the failure as before.
+        Per-text dispatch decisions, such as step fusion, are made here
+        rather than on every call.
+        """
+        if self._compiled_steps is None:
+            compiled_steps = []
+            for step_name in self.config.steps:
+                step_params = self._get_step_params(step_name)
+                try:
+                    step = self.step_registry.create_step(
+                        step_name, step_params)
+                    compiled_steps.append(CompiledStep(step_name, step_params, step))
+                except Exception as e:
+                    compiled_steps.append(CompiledStep(
+                        step_name, step_params, e, error_traceback=e.__traceback__))
+
+            # Build fused functions once for adjacent pairs that support it
+            for index in range(len(compiled_steps) - 1):
+                first, second = compiled_steps[index].step, compiled_steps[index + 1].step
+                fused = build_clean_transform(first, second)
+                if fused is None and self.config.token_stream:
+                    fused = build_token_stream(first, second)
+                if fused is not None:
+                    compiled_steps[index] = compiled_steps[index]._replace(
+                        fused=fused)
+
+            self._compiled_steps = compiled_steps
+
+        return self._compiled_steps
+
+    def warmup(self, text: str = WARMUP_TEXT) -> None:
+        """Build the steps and run each once on a sample text.
+
+        Moves one-time costs, such as step instantiation and filling the
+        lazily built character tables and caches, out of the first call
+        to process(). Statistics are left untouched, and a step that
+        fails here is skipped so the failure surfaces on real input.
+        """
+        fused_tail = False
+        for step_name, _, step, fused, _ in self._build_steps():
+            if isinstance(step, Exception):
+                continue
+            try:
+                if fused_tail:
+                    fused_tail = False
+                elif fused is not None:
+                    text = fused(text)
+                    fused_tail = True
+                elif isinstance(step, AnalyzeStep):
+                    step.analyze(text)
+                else:
+                    text = step.process(text)
+            except Exception as e:
+                logger.debug("Warmup of step '%s' failed: %s", step_name, e)
+
+    def _process_parallel(self, texts: List[str]) -> List[ProcessingResult]:
+        """Process a list of texts across a pool of worker processes."""
+        workers = self.config.max_workers or os.cpu_count() or 1
+        outputs = run_in_pool(self, _process_in_worker, texts, workers,
+                              initializer=_init_worker)
+
+        # Statistics describe the last processed text, as in the sequential path
+        self.statistics = outputs[-1][1]
+        return [result for result, _ in outputs]
 
     def _process_single(self, text: str) -> ProcessingResult:
         """Process a single text string through the pipeline."""
+        return self._process_single_with_steps(text, self._build_steps())
+
+    def _process_single_with_steps(self, text: str, steps: List[CompiledStep]) -> ProcessingResult:
+        """Process a single text string through pre-built pipeline steps."""
         logger.info(
-            f"Starting text processing pipeline with {len(self.config.steps)} steps")
+            "Starting text processing pipeline with %d steps", len(self.config.steps))
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         self.statistics.reset()
         current_text = text
         analysis = {}
 
-        try:
-            for step_name in self.config.steps:
-                logger.info(f"Executing step: {step_name}")
-
-                try:
-                    # Get step parameters
-                    step_params = self._get_step_params(step_name)
-
-                    # Create and execute step
-                    step = self.step_registry.create_step(
-                        step_name, step_params)
-                    processed_text, execution_time = step.execute(current_text)
-
-                    # Record successful execution
-                    self.statistics.record_step_success(
-                        step_name, execution_time, step_params)
-                    current_text = processed_text
-
-                    # If this is the analyze step, collect analysis results
-                    if step_name == 'analyze' and hasattr(step, 'analyze'):
-                        analysis = step.analyze(current_text)
-                        self.statistics.record_analysis(analysis)
+        fused_tail = False
 
-                    logger.info(f"Step '{step_name}' completed successfully")
-
-                except StepError as e:
-                    logger.error(f"Step '{step_name}' failed: {e.message}")
-                    self.statistics.record_step_failure(
-                        step_name, 0, e.message, {})
-
-                    if self.config.error_handling == 'stop':
-                        raise
-                    # Continue with previous text output
-
-                except Exception as e:
-                    logger.error(
-                        f"Unexpected error in step '{step_name}': {e}")
-                    self.statistics.record_step_failure(
-                        step_name, 0, str(e), {})
-
-                    if self.config.error_handling == 'stop':
-                        raise
-                    # Continue with previous text output
+        try:
+            for compiled_step in steps:
+                current_text, fused_tail, step_analysis = self._run_step(
+                    compiled_step, current_text, fused_tail, self.statistics)
+                if step_analysis is not None:
+                    analysis = step_analysis
 
         finally:
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_time) * 1e-9
 
         # Tokenize the final result using spaCy
         tokenized_text = self._tokenize_text(current_text)
+        result = self._make_result(
+            current_text, tokenized_text, processing_time, analysis, self.statistics)
 
-        # Create and return result
-        result = ProcessingResult(
-            processed_text=current_text,
+        logger.info("Pipeline completed. Applied %d steps, skipped %d steps",
+                    len(self.statistics.steps_applied), len(self.statistics.steps_skipped))
+
+        return result
+
+    def _process_batch_with_steps(self, texts: List[str], steps: List[CompiledStep]) -> List[ProcessingResult]:
+        """Process several texts step by step, batching steps that support it.
+
+        Each step runs over every text before the next one starts, so
+        steps that override process_batch, such as the spaCy steps, see
+        the whole list at once. Fused and analysis steps, failed steps and
+        steps without their own process_batch still run per text, and a
+        batch that raises is retried per text, so results and error
+        records match processing the texts one at a time. Step and
+        processing times are shared evenly between the texts.
+        """
+        logger.info("Starting text processing pipeline with %d steps for %d texts",
+                    len(self.config.steps), len(texts))
+
+        start_time = time.perf_counter_ns()
+        collectors = [StatisticsCollector() for _ in texts]
+        current_texts = list(texts)
+        analyses: List[Dict[str, Any]] = [{} for _ in texts]
+        fused_tails = [False] * len(texts)
+
+        for compiled_step in steps:
+            if not any(fused_tails) and self._run_step_batch(compiled_step, current_texts, collectors):
+                continue
+            for index, statistics in enumerate(collectors):
+                current_texts[index], fused_tails[index], step_analysis = self._run_step(
+                    compiled_step, current_texts[index], fused_tails[index], statistics)
+                if step_analysis is not None:
+                    analyses[index] = step_analysis
+
+        processing_time = (time.perf_counter_ns() - start_time) * 1e-9 / len(texts)
+        tokenized_texts = self._tokenize_texts(current_texts)
+
+        # Statistics describe the last processed text, as in the sequential path
+        self.statistics = collectors[-1]
+        results = [
+            self._make_result(text, tokens, processing_time, analysis, statistics)
+            for text, tokens, analysis, statistics in zip(
+                current_texts, tokenized_texts, analyses, collectors)
+        ]
+
+        logger.info("Pipeline completed for %d texts", len(texts))
+        return results
+
+    def _run_step(self, compiled_step: CompiledStep, text: str, fused_tail: bool,
+                  statistics: StatisticsCollector) -> Tuple[str, bool, Optional[Dict[str, Any]]]:
+        """Run one step on one text, recording the outcome in statistics.
+
+        Returns the step's output text (the input text if the step
+        failed and errors are continued past), whether the next step was
+        covered by a fused pass, and the analysis if the step produced
+        one.
+        """
+        step_name, step_params, step, fused, error_traceback = compiled_step
+        logger.debug("Executing step: %s", step_name)
+        analysis = None
+
+        try:
+            # Re-raise instantiation failures per text. Restoring the
+            # original traceback stops it growing with every raise.
+            if isinstance(step, Exception):
+                raise step.with_traceback(error_traceback)
+
+            if fused_tail:
+                # Output was already produced by the fused pass
+                fused_tail = False
+                processed_text, execution_time = text, 0.0
+            elif step_name == 'analyze' and isinstance(step, AnalyzeStep):
+                # AnalyzeStep.process returns its input unchanged, so
+                # skip execute() and time the analysis itself
+                analysis_start = time.perf_counter_ns()
+                analysis = step.analyze(text)
+                execution_time = (time.perf_counter_ns() - analysis_start) * 1e-9
+                processed_text = text
+                statistics.record_analysis(analysis)
+            elif fused is not None:
+                processed_text, execution_time = self._execute_fused(
+                    text, step, fused)
+                fused_tail = True
+            else:
+                # Execute step
+                processed_text, execution_time = step.execute(text)
+
+            # Record successful execution
+            statistics.record_step_success(
+                step_name, execution_time, step_params)
+            text = processed_text
+
+            # Collect analysis results from custom analyze steps
+            if step_name == 'analyze' and not isinstance(step, AnalyzeStep) \
+                    and hasattr(step, 'analyze'):
+                analysis = step.analyze(text)
+                statistics.record_analysis(analysis)
+
+            logger.debug("Step '%s' completed successfully", step_name)
+
+        except StepError as e:
+            logger.error(f"Step '{step_name}' failed: {e.message}")
+            statistics.record_step_failure(
+                step_name, 0, e.message, {})
+
+            if self.config.error_handling == 'stop':
+                raise
+            # Continue with previous text output
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error in step '{step_name}': {e}")
+            statistics.record_step_failure(
+                step_name, 0, str(e), {})
+
+            if self.config.error_handling == 'stop':
+                raise
+            # Continue with previous text output
+
+        return text, fused_tail, analysis
+
+    def _run_step_batch(self, compiled_step: CompiledStep, texts: List[str],
+                        collectors: List[StatisticsCollector]) -> bool:
+        """Run one step over all texts with its process_batch, in place.
+
+        Returns False, leaving the texts untouched, when the step has to
+        run per text: it failed to instantiate, is fused or an analysis
+        step, has no process_batch of its own, or its batch raised.
+        """
+        step_name, step_params, step, fused, _ = compiled_step
+        if isinstance(step, Exception) or fused is not None or step_name == 'analyze' \
+                or type(step).process_batch is BaseStep.process_batch:
+            return False
+
+        logger.debug("Executing step: %s on %d texts", step_name, len(texts))
+        start_time = time.perf_counter_ns()
+        try:
+            outputs = step.process_batch(texts)
+        except Exception as e:
+            # Per-text runs record exactly which texts fail
+            logger.debug("Batch of step '%s' failed, retrying per text: %s", step_name, e)
+            return False
+
+        execution_time = (time.perf_counter_ns() - start_time) * 1e-9 / len(texts)
+        for statistics in collectors:
+            statistics.record_step_success(step_name, execution_time, step_params)
+        texts[:] = outputs
+        return True
+
+    def _make_result(self, text: str, tokenized_text: List[str], processing_time: float,
+                     analysis: Dict[str, Any], statistics: StatisticsCollector) -> ProcessingResult:
+        """Create the result for one processed text."""
+        # Validation already builds new lists, so the collector's lists are
+        # passed without copying them first
+        return ProcessingResult(
+            processed_text=text,
             tokenized_text=tokenized_text,
-            steps_applied=self.statistics.steps_applied.copy(),
-            steps_skipped=self.statistics.steps_skipped.copy(),
+            steps_applied=statistics.steps_applied,
+            steps_skipped=statistics.steps_skipped,
             processing_time=processing_time,
             analysis=analysis,
-            errors=self.statistics.errors.copy()
+            errors=statistics.errors
         )
 
-        logger.info(f"Pipeline completed. Applied {len(self.statistics.steps_applied)} steps, "
-                    f"skipped {len(self.statistics.steps_skipped)} steps")
+    def _execute_fused(self, text: str, step: BaseStep, fused: Callable[[str], str]) -> Tuple[str, float]:
+        """Run a fused clean -> transform function in place of both steps.
 
-        return result
+        Failures are reported against the first (clean) step, leaving the
+        transform step to run on the unchanged text as it would have.
+        """
+        start_time = time.perf_counter_ns()
+        try:
+            result = fused(text)
+        except Exception as e:
+            raise StepError(step.__class__.__name__, str(e), e)
+        return result, (time.perf_counter_ns() - start_time) * 1e-9
 
     def _tokenize_text(self, text: str) -> List[str]:
         """Tokenize text using spaCy."""
@@ -199,6 +430,35 @@ class TextPipeline:
                 "No spaCy model available, using simple whitespace tokenization")
             return text.split()
 
+    def _tokenize_texts(self, texts: List[str]) -> List[List[str]]:
+        """Tokenize several texts, running spaCy over them as one batch."""
+        if self.nlp is not None:
+            docs = self.nlp.pipe(texts, batch_size=PIPE_BATCH_SIZE)
+            return [[token.text for token in doc] for doc in docs]
+        return [self._tokenize_text(text) for text in texts]
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get current pipeline statistics."""
         return self.statistics.get_summary()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the built steps when pickling; they are rebuilt on first use.
+
+        Fused step functions are closures and can't be pickled, which
+        matters when worker processes are spawned rather than forked.
+        """
+        state = self.__dict__.copy()
+        state['_compiled_steps'] = None
+        return state
+
+
+def _init_worker(pipeline: TextPipeline) -> None:
+    """Prepare a worker's copy of the pipeline."""
+    if pipeline.config.warmup:
+        pipeline.warmup()
+
+
+def _process_in_worker(pipeline: TextPipeline, text: str) -> Tuple[ProcessingResult, StatisticsCollector]:
+    """Process one text in a worker and return its result and statistics."""
+    result = pipeline._process_single(text)
+    return result, pipeline.statistics
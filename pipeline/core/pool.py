@@ -0,0 +1,40 @@
+"""Process-pool execution shared by the pipeline and its steps."""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Object installed in the current worker process by run_in_pool
+_worker_object: Any = None
+
+
+def _install_worker_object(obj: T, initializer: Optional[Callable[[T], None]]) -> None:
+    """Install the object used by this worker process."""
+    global _worker_object
+    _worker_object = obj
+    if initializer is not None:
+        initializer(obj)
+
+
+def _call_with_worker_object(fn: Callable[[T, Any], R], item: Any) -> R:
+    """Apply fn to the worker's object and one item."""
+    return fn(_worker_object, item)
+
+
+def run_in_pool(obj: T, fn: Callable[[T, Any], R], items: List[Any], workers: int,
+                initializer: Optional[Callable[[T], None]] = None) -> List[R]:
+    """Map fn(obj, item) over items across a pool of worker processes.
+
+    obj is shipped to each worker once, when the worker starts, instead
+    of with every chunk of items, and initializer (if given) is then
+    called on the worker's copy. fn and initializer must be module-level
+    functions so they can be pickled. Results keep the order of items.
+    """
+    chunksize = max(1, len(items) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_install_worker_object,
+                             initargs=(obj, initializer)) as executor:
+        return list(executor.map(partial(_call_with_worker_object, fn), items,
+                                 chunksize=chunksize))
@@ -0,0 +1,64 @@
+"""Pluggable regex engine for the pipeline's precompiled patterns."""
+
+import os
+import re
+import sys
+import logging
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Set PIPELINE_REGEX_ENGINE=re2 to compile eligible patterns with RE2's
+# linear-time DFA engine (requires the google-re2 package). The standard
+# library engine stays the default: for the short inputs this pipeline
+# sees, the per-call overhead of the RE2 bindings outweighs its matcher.
+ENGINE_NAME = os.environ.get('PIPELINE_REGEX_ENGINE', 're').lower()
+
+_engine = re
+if ENGINE_NAME == 're2':
+    try:
+        import re2 as _engine
+    except ImportError:
+        logger.warning(
+            "PIPELINE_REGEX_ENGINE=re2 but google-re2 is not installed, using re")
+        ENGINE_NAME = 're'
+
+
+def _unicode_class(predicate: Callable[[str], bool]) -> str:
+    """Spell out the code points matching predicate as RE2 class ranges."""
+    ranges = []
+    start = previous = None
+    for codepoint in range(sys.maxunicode + 1):
+        if predicate(chr(codepoint)):
+            if start is None:
+                start = codepoint
+            previous = codepoint
+        elif start is not None:
+            ranges.append((start, previous))
+            start = None
+    if start is not None:
+        ranges.append((start, previous))
+    return ''.join(f'\\x{{{lo:x}}}' if lo == hi else f'\\x{{{lo:x}}}-\\x{{{hi:x}}}'
+                   for lo, hi in ranges)
+
+
+# Character class contents (for use inside [...]) matching what \d and \s
+# match in re. RE2's own \d and \s are ASCII-only, so with RE2 the Unicode
+# code points are listed explicitly.
+if ENGINE_NAME == 're2':
+    DIGIT = _unicode_class(str.isdecimal)
+    SPACE = _unicode_class(str.isspace)
+else:
+    DIGIT = r'\d'
+    SPACE = r'\s'
+
+
+def compile(pattern: str):
+    """Compile a pattern with the configured engine.
+
+    Only use this for patterns whose meaning is the same in both engines:
+    explicit ASCII character classes, or the DIGIT and SPACE class
+    contents above in place of \\d and \\s. Patterns needing other
+    Unicode-aware classes, such as \\w, should be compiled with re directly.
+    """
+    return _engine.compile(pattern)
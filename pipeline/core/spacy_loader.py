@@ -0,0 +1,42 @@
+"""Shared loading of the spaCy English models."""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import spacy
+from spacy.language import Language
+
+# Trained pipeline components of the en_core_web models
+PIPELINE_COMPONENTS: Tuple[str, ...] = (
+    "tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter")
+
+# Number of texts spaCy processes together with nlp.pipe
+PIPE_BATCH_SIZE = 64
+
+
+def is_blank(text: str) -> bool:
+    """Check whether a text is empty or whitespace-only.
+
+    spaCy tokenizes such a text as at most one whitespace token spanning
+    all of it, so callers can answer without building a Doc.
+    """
+    return not text or text.isspace()
+
+
+@lru_cache(maxsize=None)
+def load_english_model(exclude: Tuple[str, ...] = ()) -> Optional[Language]:
+    """Load an English model without the excluded components, once per process.
+
+    Steps and pipelines asking for the same components share one Language
+    object instead of each loading their own copy. A missing model is
+    cached too, so it is only looked up once.
+    """
+    try:
+        return spacy.load("en_core_web_sm", exclude=list(exclude))
+    except OSError:
+        # Fallback to basic English model if en_core_web_sm is not available
+        try:
+            return spacy.load("en_core_web_lg", exclude=list(exclude))
+        except OSError:
+            # If no spaCy model is available, we'll handle it gracefully
+            return None
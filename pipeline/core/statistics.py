@@ -1,6 +1,8 @@
 """Statistics collection for the text processing pipeline."""
 
-from typing import List, Dict, Any
+import math
+from array import array
+from typing import List, Dict, Any, Optional
 from ..models.data import StepMetadata
 
 
@@ -12,56 +14,87 @@ class StatisticsCollector:
         self.steps_applied: List[str] = []
         self.steps_skipped: List[str] = []
         self.errors: List[str] = []
-        self.step_metadata: List[StepMetadata] = []
         self.analysis_results: Dict[str, Any] = {}
+        self._reset_step_records()
+
+    def _reset_step_records(self) -> None:
+        """Start fresh per-execution records.
+
+        Executions are stored column-wise, with times and outcomes in
+        typed arrays, instead of building a StepMetadata model per step.
+        """
+        self._names: List[str] = []
+        self._times = array('d')
+        self._success = array('b')
+        self._error_messages: List[Optional[str]] = []
+        self._parameters: List[Dict[str, Any]] = []
+
+    def _record(self, step_name: str, execution_time: float, success: bool,
+                error_message: Optional[str], parameters: Dict[str, Any]) -> None:
+        """Append one step execution to the records."""
+        self._names.append(step_name)
+        self._times.append(execution_time)
+        self._success.append(success)
+        self._error_messages.append(error_message)
+        self._parameters.append(parameters)
+
+    @property
+    def step_metadata(self) -> List[StepMetadata]:
+        """Metadata for each recorded step execution, built on demand."""
+        return [
+            StepMetadata(
+                step_name=name,
+                execution_time=execution_time,
+                success=bool(success),
+                error_message=error_message,
+                parameters=parameters
+            )
+            for name, execution_time, success, error_message, parameters in zip(
+                self._names, self._times, self._success, self._error_messages, self._parameters)
+        ]
 
     def record_step_success(self, step_name: str, execution_time: float, parameters: Dict[str, Any]) -> None:
         """Record a successful step execution."""
         self.steps_applied.append(step_name)
-        metadata = StepMetadata(
-            step_name=step_name,
-            execution_time=execution_time,
-            success=True,
-            parameters=parameters
-        )
-        self.step_metadata.append(metadata)
+        self._record(step_name, execution_time, True, None, parameters)
 
     def record_step_failure(self, step_name: str, execution_time: float, error_message: str, parameters: Dict[str, Any]) -> None:
         """Record a failed step execution."""
         self.steps_skipped.append(step_name)
         self.errors.append(f"{step_name}: {error_message}")
-        metadata = StepMetadata(
-            step_name=step_name,
-            execution_time=execution_time,
-            success=False,
-            error_message=error_message,
-            parameters=parameters
-        )
-        self.step_metadata.append(metadata)
+        self._record(step_name, execution_time, False,
+                     error_message, parameters)
 
     def record_analysis(self, analysis_results: Dict[str, Any]) -> None:
         """Record analysis results."""
         self.analysis_results.update(analysis_results)
 
     def reset(self) -> None:
-        """Reset all statistics."""
-        self.steps_applied.clear()
-        self.steps_skipped.clear()
-        self.errors.clear()
-        self.step_metadata.clear()
-        self.analysis_results.clear()
+        """Reset all statistics.
+
+        Fresh containers replace the old ones rather than clearing them,
+        so anything still holding the old ones keeps describing its run.
+        """
+        self.steps_applied = []
+        self.steps_skipped = []
+        self.errors = []
+        self.analysis_results = {}
+        self._reset_step_records()
 
     def get_summary(self) -> Dict[str, Any]:
-        """Get a summary of all statistics."""
-        total_execution_time = sum(
-            meta.execution_time for meta in self.step_metadata)
+        """Get a summary of all statistics.
+
+        The lists are returned as tuples and the analysis results as a
+        shallow copy, so the summary stays JSON serializable and picklable.
+        """
+        total_execution_time = math.fsum(self._times)
 
         return {
-            'steps_applied': self.steps_applied.copy(),
-            'steps_skipped': self.steps_skipped.copy(),
-            'errors': self.errors.copy(),
+            'steps_applied': tuple(self.steps_applied),
+            'steps_skipped': tuple(self.steps_skipped),
+            'errors': tuple(self.errors),
             'total_execution_time': total_execution_time,
-            'step_count': len(self.step_metadata),
-            'success_rate': len(self.steps_applied) / max(len(self.step_metadata), 1),
-            'analysis_results': self.analysis_results.copy()
+            'step_count': len(self._times),
+            'success_rate': len(self.steps_applied) / max(len(self._times), 1),
+            'analysis_results': dict(self.analysis_results)
         }
@@ -2,6 +2,16 @@
 
 from typing import Dict, Type, List
 from .base_step import BaseStep
+from ..steps.clean_step import CleanStep
+from ..steps.transform_step import TransformStep
+from ..steps.analyze_step import AnalyzeStep
+
+# Built-in steps, shared by every registry instance
+_DEFAULT_STEPS: Dict[str, Type[BaseStep]] = {
+    'clean': CleanStep,
+    'transform': TransformStep,
+    'analyze': AnalyzeStep,
+}
 
 
 class StepRegistry:
@@ -14,14 +24,7 @@ class StepRegistry:
 
     def _register_default_steps(self) -> None:
         """Register the default processing steps."""
-        # Import here to avoid circular imports
-        from ..steps.clean_step import CleanStep
-        from ..steps.transform_step import TransformStep
-        from ..steps.analyze_step import AnalyzeStep
-
-        self.register_step('clean', CleanStep)
-        self.register_step('transform', TransformStep)
-        self.register_step('analyze', AnalyzeStep)
+        self._steps.update(_DEFAULT_STEPS)
 
     def register_step(self, name: str, step_class: Type[BaseStep]) -> None:
         """Register a new step class."""
@@ -15,6 +15,10 @@ class StepError(PipelineError):
         self.original_error = original_error
         super().__init__(f"Step '{step_name}' failed: {message}")
 
+    def __reduce__(self):
+        """Pickle with the constructor's arguments, e.g. to leave a worker process."""
+        return (self.__class__, (self.step_name, self.message, self.original_error))
+
 
 class ConfigurationError(PipelineError):
     """Exception raised for configuration errors."""
@@ -1,7 +1,7 @@
 """Configuration models for the text processing pipeline."""
 
 from pydantic import BaseModel, Field
-from typing import List, Dict, Literal, Any
+from typing import List, Dict, Literal, Any, Optional
 
 
 class CleanStepConfig(BaseModel):
@@ -9,6 +9,7 @@ class CleanStepConfig(BaseModel):
     remove_extra_spaces: bool = True
     preserve_newlines: bool = False
     trim_edges: bool = True
+    fast_tokenizer: bool = False  # Filter with a regex tokenizer instead of spaCy
 
 
 class TransformStepConfig(BaseModel):
@@ -27,6 +28,7 @@ class AnalyzeStepConfig(BaseModel):
     count_paragraphs: bool = True
     average_word_length: bool = True
     reading_level: bool = True
+    cache_results: bool = False
 
 
 class PipelineConfig(BaseModel):
@@ -35,6 +37,10 @@ class PipelineConfig(BaseModel):
     error_handling: Literal['continue', 'stop'] = 'continue'
     logging_level: str = 'INFO'
     step_params: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    parallel: bool = False  # Process list inputs across worker processes
+    max_workers: Optional[int] = Field(default=None, ge=1)
+    warmup: bool = False  # Run the steps once on a sample during construction
+    token_stream: bool = False  # Hand clean's tokens to transform without re-tokenizing
 
     class Config:
         extra = "forbid"  # Don't allow extra fields
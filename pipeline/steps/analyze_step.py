@@ -1,20 +1,30 @@
 """Text analysis step implementation."""
 
 import re
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Tuple
+from ..core import regex_engine
 from ..core.base_step import BaseStep
 
+# Sentence and syllable patterns, compiled once at import. A sentence is
+# a run of text between [.!?] boundaries containing a non-space character;
+# it relies on Unicode \s, so it stays on the stdlib engine.
+_SENTENCE = re.compile(r'[^.!?\s][^.!?]*')
+_VOWEL_GROUPS = regex_engine.compile(r'[aeiouy]+')
+
+# Parameters the analysis reads, and so the only ones in its cache key
+_ANALYSIS_OPTIONS = (
+    'count_words', 'count_characters', 'count_sentences',
+    'count_paragraphs', 'average_word_length', 'reading_level'
+)
+
 
 class AnalyzeStep(BaseStep):
     """Step for analyzing text and generating statistics."""
 
     def validate_params(self) -> None:
         """Validate analyze step parameters."""
-        required_params = [
-            'count_words', 'count_characters', 'count_sentences',
-            'count_paragraphs', 'average_word_length', 'reading_level'
-        ]
-        for param in required_params:
+        for param in _ANALYSIS_OPTIONS:
             if param not in self.params:
                 raise ValueError(f"Missing required parameter: {param}")
 
@@ -26,14 +36,32 @@ class AnalyzeStep(BaseStep):
 
     def analyze(self, text: str) -> Dict[str, Any]:
         """Perform text analysis and return statistics."""
+        if self.params.get('cache_results', False):
+            # Other parameters may be unhashable, and the options are only
+            # tested for truth, so the key holds just their truth values
+            options = frozenset((name, bool(self.params[name])) for name in _ANALYSIS_OPTIONS)
+            analysis = dict(_cached_analysis(text, options))
+            # Copy the nested dict too so callers can't mutate the cached entry
+            if 'reading_level' in analysis:
+                analysis['reading_level'] = dict(analysis['reading_level'])
+            return analysis
+
+        return self._analyze(text)
+
+    def _analyze(self, text: str) -> Dict[str, Any]:
+        """Compute the analysis statistics for the text."""
         analysis = {}
 
+        # Split words and count sentences at most once and share them between metrics
+        words = text.split() if self.params['count_words'] else None
+        sentence_count = self._count_sentences(
+            text) if self.params['count_sentences'] else None
+
         if self.params['count_characters']:
             analysis['character_count'] = len(text)
-            analysis['character_count_no_spaces'] = len(text.replace(' ', ''))
+            analysis['character_count_no_spaces'] = len(text) - text.count(' ')
 
-        if self.params['count_words']:
-            words = text.split()
+        if words is not None:
             analysis['word_count'] = len(words)
 
             if self.params['average_word_length'] and words:
@@ -41,24 +69,16 @@ class AnalyzeStep(BaseStep):
                 analysis['average_word_length'] = round(
                     total_length / len(words), 2)
 
-        if self.params['count_sentences']:
-            # Simple sentence counting - split on sentence-ending punctuation
-            sentences = re.split(r'[.!?]+', text)
-            sentences = [s.strip() for s in sentences if s.strip()]
-            analysis['sentence_count'] = len(sentences)
+        if sentence_count is not None:
+            analysis['sentence_count'] = sentence_count
 
         if self.params['count_paragraphs']:
-            paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
-            analysis['paragraph_count'] = len(paragraphs)
+            analysis['paragraph_count'] = self._count_paragraphs(text)
 
-        if self.params['reading_level'] and self.params['count_words'] and self.params['count_sentences']:
+        if self.params['reading_level'] and words is not None and sentence_count is not None:
             # Simple Flesch Reading Ease approximation
-            words = text.split()
-            sentences = re.split(r'[.!?]+', text)
-            sentences = [s.strip() for s in sentences if s.strip()]
-
-            if words and sentences:
-                avg_sentence_length = len(words) / len(sentences)
+            if words and sentence_count:
+                avg_sentence_length = len(words) / sentence_count
                 avg_syllables = sum(self._count_syllables(word)
                                     for word in words) / len(words)
 
@@ -72,26 +92,17 @@ class AnalyzeStep(BaseStep):
 
         return analysis
 
-    def _count_syllables(self, word: str) -> int:
-        """Count syllables in a word (approximation)."""
-        word = word.lower()
-        vowels = 'aeiouy'
-        syllable_count = 0
-        prev_was_vowel = False
+    def _count_sentences(self, text: str) -> int:
+        """Count non-empty sentences without building the sentence strings."""
+        return sum(1 for _ in _SENTENCE.finditer(text))
 
-        for char in word:
-            if char in vowels:
-                if not prev_was_vowel:
-                    syllable_count += 1
-                prev_was_vowel = True
-            else:
-                prev_was_vowel = False
+    def _count_paragraphs(self, text: str) -> int:
+        """Count non-empty paragraphs separated by blank lines."""
+        return len([p for p in text.split('\n\n') if p and not p.isspace()])
 
-        # Handle silent 'e'
-        if word.endswith('e') and syllable_count > 1:
-            syllable_count -= 1
-
-        return max(1, syllable_count)
+    def _count_syllables(self, word: str) -> int:
+        """Count syllables in a word (approximation)."""
+        return _count_syllables(word)
 
     def _get_difficulty_level(self, flesch_score: float) -> str:
         """Get difficulty level from Flesch score."""
@@ -109,3 +120,23 @@ class AnalyzeStep(BaseStep):
             return "Difficult"
         else:
             return "Very Difficult"
+
+
+@lru_cache(maxsize=8192)
+def _count_syllables(word: str) -> int:
+    """Count syllables in a word (approximation), memoized per word."""
+    word = word.lower()
+    # Each run of consecutive vowels counts as one syllable
+    syllable_count = len(_VOWEL_GROUPS.findall(word))
+
+    # Handle silent 'e'
+    if word.endswith('e') and syllable_count > 1:
+        syllable_count -= 1
+
+    return max(1, syllable_count)
+
+
+@lru_cache(maxsize=1024)
+def _cached_analysis(text: str, params: FrozenSet[Tuple[str, Any]]) -> Dict[str, Any]:
+    """Memoized analysis keyed on the text and the frozen analysis options."""
+    return AnalyzeStep(dict(params))._analyze(text)
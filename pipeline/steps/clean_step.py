@@ -1,8 +1,67 @@
 """Text cleaning step implementation."""
-import spacy
 import re
-from typing import Dict, Any
-from ..core.base_step import BaseStep
+import unicodedata
+from dataclasses import dataclass, fields
+from typing import Dict, Any, List
+import numpy as np
+from spacy.attrs import IS_PUNCT, IS_STOP, ORTH
+from spacy.lang.en.stop_words import STOP_WORDS
+from ..core import regex_engine
+from ..core.base_step import BaseStep, chain_passes
+from ..core.spacy_loader import PIPE_BATCH_SIZE, PIPELINE_COMPONENTS, is_blank, load_english_model
+
+# Whitespace patterns used by CleanStep.process, compiled once at import.
+# _WS_SPACES skips lone spaces, which would only be replaced by themselves.
+_WS_SPACES = regex_engine.compile(r' [ \t]+|\t[ \t]*')
+_WS_BLANKLINE = regex_engine.compile(r'\n[ \t]*\n')
+_WS_ALL = regex_engine.compile(f'[{regex_engine.SPACE}]+')
+
+# Docs with at least this many tokens are filtered through Doc.to_array
+# instead of Token objects; for these three attributes it breaks even
+# at around 55 tokens
+_ARRAY_MIN_TOKENS = 64
+_FILTER_ATTRS = [IS_STOP, IS_PUNCT, ORTH]
+
+# Tokens for the fast filter: words with inner apostrophes, or single symbols
+_FAST_TOKEN = re.compile(r"\w+(?:'\w+)*|[^\w\s]")
+
+
+def _collapse_spaces(text: str) -> str:
+    """Collapse runs of spaces and tabs, and of blank lines, keeping newlines."""
+    result = _WS_SPACES.sub(' ', text)
+    if '\n' in result:
+        result = _WS_BLANKLINE.sub('\n\n', result)
+    return result
+
+
+def _collapse_split(text: str) -> str:
+    """Collapse every whitespace run in a trimmed text without a regex."""
+    return ' '.join(text.split())
+
+
+def _collapse_all(text: str) -> str:
+    """Replace every whitespace run with a single space."""
+    return _WS_ALL.sub(' ', text)
+
+
+def _is_punct(token: str) -> bool:
+    """Match spaCy's is_punct: every character is Unicode punctuation."""
+    return all(unicodedata.category(char).startswith('P') for char in token)
+
+
+@dataclass(frozen=True, slots=True)
+class CleanOptions:
+    """Clean step parameters, read as attributes on the hot paths."""
+    remove_extra_spaces: bool
+    preserve_newlines: bool
+    trim_edges: bool
+    lowercase: bool
+    remove_punctuation: bool
+    remove_stopwords: bool
+    fast_tokenizer: bool = False
+
+
+_OPTION_NAMES = [field.name for field in fields(CleanOptions)]
 
 
 class CleanStep(BaseStep):
@@ -11,16 +70,57 @@ class CleanStep(BaseStep):
     def __init__(self, params: Dict[str, Any]):
         """Initialize the clean step with spaCy model."""
         super().__init__(params)
-        # Load spaCy model for punctuation and stop word removal
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # Fallback to basic English model if en_core_web_sm is not available
-            try:
-                self.nlp = spacy.load("en_core_web_lg")
-            except OSError:
-                # If no spaCy model is available, we'll handle it gracefully
-                self.nlp = None
+        self._options = CleanOptions(
+            **{name: self.params[name] for name in _OPTION_NAMES if name in self.params})
+        self._build_normalizer()
+
+        # The fast filter does punctuation and stop word removal itself
+        self._fast_filter = bool(self._options.fast_tokenizer)
+        if self._fast_filter:
+            self.nlp = None
+            self._uses_spacy = False
+            return
+
+        # Load spaCy model for punctuation and stop word removal. is_stop,
+        # is_punct and text come from the tokenizer, so no pipeline
+        # components are needed.
+        self.nlp = load_english_model(PIPELINE_COMPONENTS)
+        # Without either filter, tokenizing would only lowercase the text
+        self._uses_spacy = bool(
+            self._options.remove_stopwords or self._options.remove_punctuation)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the whitespace normalizer when pickling; it may be a closure."""
+        state = self.__dict__.copy()
+        del state['_normalize_whitespace']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled step, rebuilding its whitespace normalizer."""
+        self.__dict__.update(state)
+        self._build_normalizer()
+
+    def _build_normalizer(self) -> None:
+        """Specialize whitespace normalization for this step's options.
+
+        The options are fixed once the step exists, so the trim and
+        collapse choices are made here and _normalize_whitespace only
+        runs the passes that are enabled.
+        """
+        options = self._options
+        collapse = None
+        if options.remove_extra_spaces:
+            if options.preserve_newlines:
+                collapse = _collapse_spaces
+            elif options.trim_edges:
+                # Edges are already trimmed, so splitting on whitespace and
+                # rejoining collapses every run without the regex engine
+                collapse = _collapse_split
+            else:
+                collapse = _collapse_all
+
+        self._normalize_whitespace = chain_passes(
+            [str.strip if options.trim_edges else None, collapse])
 
     def validate_params(self) -> None:
         """Validate clean step parameters."""
@@ -36,47 +136,124 @@ class CleanStep(BaseStep):
 
     def process(self, text: str) -> str:
         """Clean the input text according to parameters."""
-        result = text
+        result = self._normalize_whitespace(text)
 
-        if self.params['trim_edges']:
-            result = result.strip()
+        if self._fast_filter:
+            result = self._apply_fast_filter(result)
+        elif self.nlp is not None:
+            # Apply spaCy-based processing if model is available
+            if self._uses_spacy:
+                result = self._apply_spacy_processing(result)
+            elif self._options.lowercase:
+                result = result.lower()
 
-        if self.params['remove_extra_spaces']:
-            if self.params['preserve_newlines']:
-                # Replace multiple spaces with single space, preserve newlines
-                result = re.sub(r'[ \t]+', ' ', result)
-                result = re.sub(r'\n[ \t]*\n', '\n\n', result)
-            else:
-                # Replace all whitespace sequences with single space
-                result = re.sub(r'\s+', ' ', result)
+        return result
 
-        # Apply spaCy-based processing if model is available
-        if self.nlp is not None:
-            result = self._apply_spacy_processing(result)
+    def process_batch(self, texts: List[str], n_process: int = 1) -> List[str]:
+        """Clean several texts, running spaCy over them as one batch."""
+        self._check_n_process(n_process)
+        if self._fast_filter or self.nlp is None or not self._uses_spacy:
+            return super().process_batch(texts, n_process)
 
-        return result
+        normalized = [self._normalize_whitespace(text) for text in texts]
+        docs = self.nlp.pipe(normalized, batch_size=PIPE_BATCH_SIZE, n_process=n_process)
+        return [self._filter_doc(doc) for doc in docs]
 
-    def _apply_spacy_processing(self, text: str) -> str:
-        """Apply spaCy-based text processing for punctuation and stop words."""
-        doc = self.nlp(text)
+    def clean_to_tokens(self, text: str) -> List[str]:
+        """Clean the input text and return its tokens rather than joining them.
+
+        The tokens come from the fast filter or from spaCy punctuation and
+        stop word removal. Without either, the output of process() is
+        split on whitespace.
+        """
+        if not self._fast_filter and (self.nlp is None or not self._uses_spacy):
+            return self.process(text).split()
+
+        result = self._normalize_whitespace(text)
+        if self._fast_filter:
+            return self._fast_filter_tokens(result)
+
+        tokens = self._spacy_filter_tokens(result)
+        if self._options.lowercase:
+            # The tokens are handed over unjoined, so each is lowercased
+            return [token.lower() for token in tokens]
+        return tokens
+
+    def _apply_fast_filter(self, text: str) -> str:
+        """Remove punctuation and stop words using a regex tokenizer instead of spaCy."""
+        return ' '.join(self._fast_filter_tokens(text))
+
+    def _fast_filter_tokens(self, text: str) -> List[str]:
+        """Tokenize with the fast filter's regex and drop punctuation and stop words."""
+        options = self._options
+        remove_stopwords = options.remove_stopwords
+        remove_punctuation = options.remove_punctuation
+        lowercase = options.lowercase
         processed_tokens = []
 
-        for token in doc:
-            # Skip if it's a stop word and we want to remove stop words
-            if self.params['remove_stopwords'] and token.is_stop:
+        for token in _FAST_TOKEN.findall(text):
+            lower = token.lower()
+            if remove_stopwords and lower in STOP_WORDS:
                 continue
-
-            # Skip if it's punctuation and we want to remove punctuation
-            if self.params['remove_punctuation'] and token.is_punct:
+            if remove_punctuation and not token.isalnum() and _is_punct(token):
                 continue
+            processed_tokens.append(lower if lowercase else token)
 
-            # Apply lowercase if requested
-            if self.params['lowercase']:
-                processed_tokens.append(token.text.lower())
-            else:
-                processed_tokens.append(token.text)
+        return processed_tokens
 
-                # Join tokens back into text
-        result = ' '.join(processed_tokens)
+    def _apply_spacy_processing(self, text: str) -> str:
+        """Apply spaCy-based text processing for punctuation and stop words."""
+        return self._join_tokens(self._spacy_filter_tokens(text))
 
-        return result
+    def _spacy_filter_tokens(self, text: str) -> List[str]:
+        """Tokenize with spaCy and drop stop words and punctuation, keeping the case."""
+        # Neither filter drops a blank text's lone whitespace token
+        if is_blank(text):
+            return [text] if text else []
+        return self._filter_tokens(self.nlp(text))
+
+    def _filter_doc(self, doc) -> str:
+        """Drop stop words and punctuation from a spaCy Doc and join the rest."""
+        return self._join_tokens(self._filter_tokens(doc))
+
+    def _join_tokens(self, tokens: List[str]) -> str:
+        """Join kept tokens back into text, lowercasing it if requested."""
+        # Lowercasing the joined text once gives the same result as
+        # lowercasing each token, without a temporary string per token
+        result = ' '.join(tokens)
+        return result.lower() if self._options.lowercase else result
+
+    def _filter_tokens(self, doc) -> List[str]:
+        """Drop stop words and punctuation from a spaCy Doc, keeping the case."""
+        # Read the flags once rather than once per token
+        options = self._options
+        remove_stopwords = options.remove_stopwords
+        remove_punctuation = options.remove_punctuation
+
+        if len(doc) >= _ARRAY_MIN_TOKENS:
+            # Evaluate the filters over the Doc's attribute array at once
+            # instead of creating a Token object per token
+            attrs = doc.to_array(_FILTER_ATTRS)
+            keep = np.ones(len(doc), dtype=bool)
+            if remove_stopwords:
+                keep &= attrs[:, 0] == 0
+            if remove_punctuation:
+                keep &= attrs[:, 1] == 0
+            strings = doc.vocab.strings
+            processed_tokens = [strings[orth] for orth in attrs[keep, 2].tolist()]
+        else:
+            processed_tokens = []
+            append = processed_tokens.append
+
+            for token in doc:
+                # Skip if it's a stop word and we want to remove stop words
+                if remove_stopwords and token.is_stop:
+                    continue
+
+                # Skip if it's punctuation and we want to remove punctuation
+                if remove_punctuation and token.is_punct:
+                    continue
+
+                append(token.text)
+
+        return processed_tokens
@@ -1,10 +1,46 @@
 """Text transformation step implementation."""
 
-import re
-import string
-import spacy
-from typing import Dict, Any
-from ..core.base_step import BaseStep
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, Any, List
+import numpy as np
+from spacy.attrs import IS_ALPHA, IS_SPACE, LEMMA, LIKE_NUM, ORTH
+from spacy.tokens import Doc
+from ..core.base_step import BaseStep, chain_passes
+from ..core.deletion import build_deleter
+from ..core.spacy_loader import PIPE_BATCH_SIZE, PIPELINE_COMPONENTS, is_blank, load_english_model
+
+# Lemmas need the lemmatizer and the components that supply its POS tags
+_SPACY_EXCLUDE_WITH_LEMMAS = ("parser", "ner", "senter")
+
+# Docs with at least this many tokens are transformed through
+# Doc.to_array; reading five attributes per token moves the break-even
+# to around 100 tokens
+_ARRAY_MIN_TOKENS = 128
+_TRANSFORM_ATTRS = [LIKE_NUM, IS_ALPHA, IS_SPACE, ORTH, LEMMA]
+
+# Suffix rules for _simple_stemming as (suffix, length the word must
+# exceed, characters to strip), keyed by the suffix's last letter. Every
+# suffix ends in a different letter, so one lookup finds the only rule
+# that can apply. Plural 's' is handled separately.
+_STEM_RULES = {
+    'g': ('ing', 5, 3),
+    'd': ('ed', 4, 2),
+    'y': ('ly', 4, 2),
+    'r': ('er', 4, 2),
+    't': ('est', 5, 3),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TransformOptions:
+    """Transform step parameters, read as attributes on the hot paths."""
+    remove_numbers: bool
+    remove_special_chars: bool
+    apply_stemming: bool
+
+
+_OPTION_NAMES = [field.name for field in fields(TransformOptions)]
 
 
 class TransformStep(BaseStep):
@@ -13,16 +49,42 @@ class TransformStep(BaseStep):
     def __init__(self, params: Dict[str, Any]):
         """Initialize the transform step with spaCy model."""
         super().__init__(params)
-        # Load spaCy model for tokenization
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            # Fallback to basic English model if en_core_web_sm is not available
-            try:
-                self.nlp = spacy.load("en_core_web_lg")
-            except OSError:
-                # If no spaCy model is available, we'll handle it gracefully
-                self.nlp = None
+        self._options = options = TransformOptions(
+            **{name: self.params[name] for name in _OPTION_NAMES})
+
+        # With no flags set there is nothing for spaCy to do, so the model
+        # isn't loaded at all
+        self._uses_spacy = bool(
+            options.remove_numbers or options.remove_special_chars or options.apply_stemming)
+
+        # Load spaCy model for tokenization, without unused components.
+        # like_num, is_alpha and is_space come from the tokenizer alone.
+        exclude = _SPACY_EXCLUDE_WITH_LEMMAS if options.apply_stemming else PIPELINE_COMPONENTS
+        self.nlp = load_english_model(exclude) if self._uses_spacy else None
+
+        self._build_regex_processing()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the regex fallback when pickling; it is built from closures."""
+        state = self.__dict__.copy()
+        del state['_apply_regex_processing']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled step, rebuilding its regex fallback."""
+        self.__dict__.update(state)
+        self._build_regex_processing()
+
+    def _build_regex_processing(self) -> None:
+        """Specialize the regex fallback for this step's options.
+
+        Digit and special character removal become one deletion pass,
+        and only the enabled passes make up _apply_regex_processing.
+        """
+        options = self._options
+        self._apply_regex_processing = chain_passes([
+            build_deleter(options.remove_numbers, options.remove_special_chars),
+            self._simple_stemming if options.apply_stemming else None])
 
     def validate_params(self) -> None:
         """Validate transform step parameters."""
@@ -35,77 +97,109 @@ class TransformStep(BaseStep):
     def process(self, text: str) -> str:
         """Transform the input text according to parameters."""
         # Use spaCy tokenization if available, otherwise fall back to regex
-        if self.nlp is not None:
+        if self.nlp is not None and self._uses_spacy:
             return self._apply_spacy_processing(text)
         else:
             return self._apply_regex_processing(text)
 
+    def process_batch(self, texts: List[str], n_process: int = 1) -> List[str]:
+        """Transform several texts, running spaCy over them as one batch."""
+        self._check_n_process(n_process)
+        if self.nlp is None or not self._uses_spacy:
+            return super().process_batch(texts, n_process)
+
+        docs = self.nlp.pipe(texts, batch_size=PIPE_BATCH_SIZE, n_process=n_process)
+        return [self._transform_doc(doc) for doc in docs]
+
+    def transform_from_tokens(self, tokens: List[str]) -> str:
+        """Transform already tokenized text, skipping spaCy's tokenizer.
+
+        The Doc is built from the tokens as given and then run through
+        the model's components, so lemmas are still available. Without
+        spaCy processing the tokens are joined and passed to process().
+        """
+        if self.nlp is None or not self._uses_spacy:
+            return self.process(' '.join(tokens))
+        return self._transform_doc(self.nlp(Doc(self.nlp.vocab, words=tokens)))
+
     def _apply_spacy_processing(self, text: str) -> str:
         """Apply spaCy-based tokenization for text transformation."""
-        doc = self.nlp(text)
+        # A blank text's lone whitespace token is always kept unchanged
+        if is_blank(text):
+            return text
+        return self._transform_doc(self.nlp(text))
+
+    def _transform_doc(self, doc) -> str:
+        """Filter and lemmatize the tokens of a spaCy Doc and join them."""
+        # Read the flags once rather than once per token
+        options = self._options
+        remove_numbers = options.remove_numbers
+        remove_special_chars = options.remove_special_chars
+        apply_stemming = options.apply_stemming
+
+        if len(doc) >= _ARRAY_MIN_TOKENS:
+            return self._transform_doc_array(
+                doc, remove_numbers, remove_special_chars, apply_stemming)
+
         processed_tokens = []
+        append = processed_tokens.append
 
         for token in doc:
             # Skip if it's a number and we want to remove numbers
-            if self.params['remove_numbers'] and token.like_num:
+            if remove_numbers and token.like_num:
                 continue
 
             # Skip if it's a special character and we want to remove special chars
-            if self.params['remove_special_chars'] and not token.is_alpha and not token.is_space:
+            if remove_special_chars and not token.is_alpha and not token.is_space:
                 continue
 
             # Apply stemming/lemmatization if requested
-            if self.params['apply_stemming'] and token.is_alpha:
+            if apply_stemming and token.is_alpha:
                 # Use spaCy's lemmatization (more sophisticated than stemming)
-                processed_tokens.append(token.lemma_.lower())
+                append(token.lemma_.lower())
             else:
                 # Keep the original token
-                processed_tokens.append(token.text)
+                append(token.text)
 
         # Join tokens back into text
-        result = ' '.join(processed_tokens)
-
-        return result
+        return ' '.join(processed_tokens)
+
+    def _transform_doc_array(self, doc, remove_numbers: bool, remove_special_chars: bool,
+                             apply_stemming: bool) -> str:
+        """Transform a Doc using its attribute array instead of Token objects."""
+        attrs = doc.to_array(_TRANSFORM_ATTRS)
+        keep = np.ones(len(doc), dtype=bool)
+        if remove_numbers:
+            keep &= attrs[:, 0] == 0
+        if remove_special_chars:
+            keep &= (attrs[:, 1] != 0) | (attrs[:, 2] != 0)
+
+        strings = doc.vocab.strings
+        kept = attrs[keep]
+        if apply_stemming:
+            # Lemmatize alphabetic tokens, keep the others as they are
+            return ' '.join([strings[lemma].lower() if is_alpha else strings[orth]
+                             for is_alpha, orth, lemma in kept[:, [1, 3, 4]].tolist()])
+        return ' '.join([strings[orth] for orth in kept[:, 3].tolist()])
 
-    def _apply_regex_processing(self, text: str) -> str:
-        """Fallback regex-based processing when spaCy is not available."""
-        result = text
-
-        if self.params['remove_numbers']:
-            result = re.sub(r'\d+', '', result)
+    def _simple_stemming(self, text: str) -> str:
+        """Simple stemming implementation for fallback when spaCy is not available."""
+        # Lowercasing the whole text gives the same words as lowercasing
+        # each one, and lets differently cased words share cache entries
+        return ' '.join(map(_stem_word, text.lower().split()))
 
-        if self.params['remove_special_chars']:
-            # Remove non-alphanumeric characters (except spaces)
-            result = re.sub(r'[^a-zA-Z0-9\s]', '', result)
 
-        if self.params['apply_stemming']:
-            result = self._simple_stemming(result)
+@lru_cache(maxsize=8192)
+def _stem_word(word_lower: str) -> str:
+    """Stem one lowercase word (Porter-like rules), memoized per word."""
+    last = word_lower[-1]
 
-        return result
+    rule = _STEM_RULES.get(last)
+    if rule is not None:
+        suffix, min_length, strip = rule
+        if len(word_lower) > min_length and word_lower.endswith(suffix):
+            word_lower = word_lower[:-strip]
+    elif last == 's' and len(word_lower) > 3 and word_lower[-2] != 's':
+        word_lower = word_lower[:-1]
 
-    def _simple_stemming(self, text: str) -> str:
-        """Simple stemming implementation for fallback when spaCy is not available."""
-        # Basic Porter-like stemming rules
-        words = text.split()
-        stemmed_words = []
-
-        for word in words:
-            word_lower = word.lower()
-
-            # Simple stemming rules
-            if word_lower.endswith('ing') and len(word_lower) > 5:
-                word_lower = word_lower[:-3]
-            elif word_lower.endswith('ed') and len(word_lower) > 4:
-                word_lower = word_lower[:-2]
-            elif word_lower.endswith('ly') and len(word_lower) > 4:
-                word_lower = word_lower[:-2]
-            elif word_lower.endswith('er') and len(word_lower) > 4:
-                word_lower = word_lower[:-2]
-            elif word_lower.endswith('est') and len(word_lower) > 5:
-                word_lower = word_lower[:-3]
-            elif word_lower.endswith('s') and len(word_lower) > 3 and not word_lower.endswith('ss'):
-                word_lower = word_lower[:-1]
-
-            stemmed_words.append(word_lower)
-
-        return ' '.join(stemmed_words)
+    return word_lower